@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
 
 import argparse
-from re import match
 from datetime import datetime
-from pytz import timezone
-from tzlocal import get_localzone
+from zoneinfo import ZoneInfo
 
 timezones = [
     'America/Los_Angeles',
@@ -20,8 +18,8 @@ out_dt_format = '%A, %d %B %Y, %H:%M %Z'
 def main():
     args = get_args()
 
-    dt_begin = datetime.strptime(args['dt_begin'], in_dt_format)
-    dt_end = datetime.strptime(args['dt_end'], in_dt_format)
+    dt_begin = args['dt_begin']
+    dt_end = args['dt_end']
     dt_duration = dt_end - dt_begin
 
     print('Maintenance start time:')
@@ -43,35 +41,35 @@ def get_args():
             Expected format: dd.mm.YYYY HH:MM')
     argparser.add_argument('dt_begin',
         metavar='begin_date_time',
-        type=dt_regex,
+        type=dt_parse,
         help='example: "21.05.2018 21:30"')
     argparser.add_argument('dt_end',
         metavar='end_date_time',
-        type=dt_regex,
+        type=dt_parse,
         help='example: "21.05.2018 22:00"')
     argparser.add_argument('-d', '--duration',
         action='store_true',
         help='add duration to the output')
     return vars(argparser.parse_args())
 
-def dt_regex(arg):
+def dt_parse(arg):
     """
-    arg - a string to validate against regular expression
+    arg - a string to parse and validate against in_dt_format
     """
-    dt_re = r'\d{2}\.\d{2}\.\d{4}\ \d{2}\:\d{2}'
-    if not match(dt_re, arg):
-        raise argparse.ArgumentTypeError(f"does not match regular expression: {dt_re}")
-    return arg
+    try:
+        return datetime.strptime(arg, in_dt_format)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
 
 def tz_convert(dt_input, tz_target):
     """
-    dt_input - naive datetime object
+    dt_input - naive datetime object, interpreted as local time
     tz_target - canonical timezone string, e.g. 'America/Los_Angeles'
+
+    ZoneInfo instances are cached process-wide, so repeated conversions
+    to the same timezone reuse one object.
     """
-    tz_local = get_localzone()
-    tz_target = timezone(tz_target)
-    dt_target = tz_local.localize(dt_input).astimezone(tz_target)
-    return tz_target.normalize(dt_target)
+    return dt_input.astimezone(ZoneInfo(tz_target))
 
 if __name__ == '__main__':
     main()
@@ -4,13 +4,13 @@ import unittest
 import maintenance_datetime
 from argparse import ArgumentTypeError
 from datetime import datetime
-from pytz import common_timezones, timezone
+from zoneinfo import ZoneInfo, available_timezones
 
 class TestMaintenanceDatetime(unittest.TestCase):
     def test_timezones(self):
         timezones = maintenance_datetime.timezones
         for timezone in timezones:
-            self.assertIn(timezone, common_timezones)
+            self.assertIn(timezone, available_timezones())
 
     def test_input_datetime_format(self):
         input_string = '23.01.2019 16:45'
@@ -19,15 +19,20 @@ class TestMaintenanceDatetime(unittest.TestCase):
         self.assertEqual(result, datetime(2019, 1, 23, 16, 45))
 
     def test_output_datetime_format(self):
-        input_datetime = datetime(2019, 1, 23, 16, 45, tzinfo=timezone('UTC'))
+        input_datetime = datetime(2019, 1, 23, 16, 45, tzinfo=ZoneInfo('UTC'))
         output_format = maintenance_datetime.out_dt_format
         result = input_datetime.strftime(output_format)
         self.assertEqual(result, 'Wednesday, 23 January 2019, 16:45 UTC')
 
-    def test_input_datetime_regex(self):
+    def test_input_datetime_parse(self):
+        input_string = '23.01.2019 16:45'
+        result = maintenance_datetime.dt_parse(input_string)
+        self.assertEqual(result, datetime(2019, 1, 23, 16, 45))
+
+    def test_input_datetime_parse_invalid(self):
         input_string = '2019-12-24 11-00'
         with self.assertRaises(ArgumentTypeError):
-            maintenance_datetime.dt_regex(input_string)
+            maintenance_datetime.dt_parse(input_string)
 
 if __name__ == '__main__':
     unittest.main()
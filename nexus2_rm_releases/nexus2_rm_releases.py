@@ -4,10 +4,14 @@
 
 import argparse
 import os
-from distutils.version import LooseVersion
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 import requests
+from packaging.version import Version
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 USERNAME = str(os.environ.get('NEXUS_USERNAME'))
 PASSWORD = str(os.environ.get('NEXUS_PASSWORD'))
@@ -19,6 +23,14 @@ CONTENT_URL = f'{NEXUS_URL}/service/local/repositories/{NEXUS_REPO}/content'
 METADATA_URL = f'{NEXUS_URL}/service/local/metadata/repositories/{NEXUS_REPO}/content'
 INDEX_URL = f'{NEXUS_URL}/service/local/data_incremental_index/repositories/{NEXUS_REPO}/content'
 
+# reuse one keep-alive connection pool for all Nexus calls instead of a fresh TLS handshake per request
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                                      max_retries=Retry(total=3, backoff_factor=0.3,
+                                                        status_forcelist=[502, 503, 504])))
+session.auth = AUTH
+session.headers.update(HEADERS)
+
 argparser = argparse.ArgumentParser()
 argparser.add_argument('group_id',
                        help='group id in Maven notation to query for artifacts; example: com.company.project')
@@ -30,9 +42,9 @@ argparser.add_argument('-n', '--dry-run',
 args = argparser.parse_args()
 
 path = args.group_id.replace('.', '/')
-version = args.version
+version = Version(args.version)
 
-response = requests.get(f'{CONTENT_URL}/{path}', headers=HEADERS, auth=AUTH, timeout=10.0)
+response = session.get(f'{CONTENT_URL}/{path}', timeout=10.0)
 if response.status_code not in [200, 204]: response.raise_for_status()
 
 output = response.json().get('data')
@@ -41,27 +53,36 @@ if not output:
     print(f'No valid resources found at {response.url}')
     raise SystemExit
 
-artifacts_to_rm = {resource.get('text'): []
-                   for resource in output
-                   if resource.get('leaf') is False}
-
-for resource in output:
-    artifact = resource.get('text')
-
-    response = requests.get(resource.get('resourceURI'), headers=HEADERS, auth=AUTH, timeout=10.0)
+def fetch_versions(resource):
+    """fetch the version listing for one artifact; returns (artifact, versions)"""
+    response = session.get(resource.get('resourceURI'), timeout=10.0)
     if response.status_code not in [200, 204]: response.raise_for_status()
-
-    output = response.json().get('data')
-
-    artifacts_to_rm[artifact] = sorted(
-        list(
-            resource.get('resourceURI')
-            for resource in output
-            if resource.get('leaf') is False
-            and LooseVersion(resource.get('text')) <= LooseVersion(version)
-        ),
-        key=lambda v: LooseVersion(v)
-    )
+    return resource.get('text'), response.json().get('data') or []
+
+artifacts = [resource for resource in output if resource.get('leaf') is False]
+
+# the per-artifact GETs are independent and I/O-bound, so overlap them
+with ThreadPoolExecutor(max_workers=8) as executor:
+    results = list(executor.map(fetch_versions, artifacts))
+
+artifacts_to_rm = {}
+for artifact, versions in results:
+    # parse each release version once, then sort by the parsed form
+    releases = []
+    for resource in versions:
+        if resource.get('leaf') is not False:
+            continue
+        release = Version(resource.get('text'))
+        if release <= version:
+            releases.append((release, resource.get('resourceURI')))
+    releases.sort(key=itemgetter(0))
+    artifacts_to_rm[artifact] = [uri for _, uri in releases]
+
+def delete_release(url):
+    """delete one release version; returns the response status code"""
+    response = session.delete(url, timeout=10.0)
+    if response.status_code not in [200, 204]: response.raise_for_status()
+    return response.status_code
 
 print(f'Cleaning up artifacts for {args.group_id}, deleting release versions <={version}.')
 for artifact, urls in artifacts_to_rm.items():
@@ -70,26 +91,28 @@ for artifact, urls in artifacts_to_rm.items():
         continue
 
     print(f'{artifact}:')
-    for url in urls:
-        if args.dry_run:
+    if args.dry_run:
+        for url in urls:
             print(f' - would delete {url}')
-        else:
-            print(f' - deleting {url}')
-            response = requests.delete(url, auth=AUTH, timeout=10.0)
-            if response.status_code not in [200, 204]: response.raise_for_status()
+    else:
+        # the per-version DELETEs are independent; issue them concurrently,
+        # keeping the log output in version order via executor.map
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            for url, status_code in zip(urls, executor.map(delete_release, urls)):
+                print(f' - deleted {url} ({status_code})')
 
     if args.dry_run:
         print(f'Would request to rebuilt metadata for {artifact}.')
     else:
         print(f'Requesting to rebuild metadata for {artifact}.')
-        response = requests.delete(f'{METADATA_URL}/{path}/{artifact}', auth=AUTH, timeout=10.0)
+        response = session.delete(f'{METADATA_URL}/{path}/{artifact}', timeout=10.0)
         if response.status_code not in [200, 204]: response.raise_for_status()
 
     if args.dry_run:
         print(f'Would request to update index for {artifact}.')
     else:
         print(f'Requesting to update index for {artifact}.')
-        response = requests.delete(f'{INDEX_URL}/{path}/{artifact}', auth=AUTH, timeout=10.0)
+        response = session.delete(f'{INDEX_URL}/{path}/{artifact}', timeout=10.0)
         if response.status_code not in [200, 204]: response.raise_for_status()
 
 print('All ok!')